@@ -1,7 +1,3 @@
-from importlib.metadata import version
-
-from ._monitor import TMonitor as TMonitor
-from .aliases import auto_tldm as auto_tldm
 from .aliases import tbatched as tbatched
 from .aliases import tenumerate as tenumerate
 from .aliases import tmap as tmap
@@ -12,7 +8,27 @@ from .extensions.training import TrainingTldm as TrainingTldm
 from .extensions.training import training_tldm as training_tldm
 from .std import tldm as tldm
 
-__version__ = version("tldm")
+
+def __getattr__(name: str):
+    # PEP 562: resolve rarely-used attributes lazily so that `import tldm`
+    # skips the importlib.metadata scan and the monitor thread machinery.
+    if name == "__version__":
+        from importlib.metadata import version
+
+        v = version("tldm")
+        globals()["__version__"] = v
+        return v
+    if name == "TMonitor":
+        from ._monitor import TMonitor
+
+        globals()["TMonitor"] = TMonitor
+        return TMonitor
+    if name == "auto_tldm":
+        from .aliases import auto_tldm
+
+        globals()["auto_tldm"] = auto_tldm
+        return auto_tldm
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Syntactic sugar for pandas integration
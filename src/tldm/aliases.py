@@ -1,6 +1,7 @@
 import itertools
 import sys
 from collections.abc import Callable, Iterable, Iterator
+from math import prod
 from operator import length_hint
 from typing import Any, TypeVar
 
@@ -13,7 +14,8 @@ __all__ = [
     "tproduct",
     "tbatched",
     "trange",
-    "auto_tldm",
+    # Bound lazily by the module __getattr__ below, invisible to pyflakes.
+    "auto_tldm",  # noqa: F822
 ]
 
 
@@ -31,38 +33,53 @@ def _get_auto_tldm() -> type[tldm]:
     type[tldm]
         The appropriate tldm class based on the current environment.
     """
+    # Not running under IPython is the common CLI path: keep it a plain dict
+    # miss with an early return instead of a broad exception handler.
     try:
-        # Try to detect IPython/Jupyter notebook environment
-        get_ipython = sys.modules["IPython"].get_ipython
-        if "IPKernelApp" not in get_ipython().config:  # pragma: no cover
-            raise ImportError("console")
+        ipython = sys.modules["IPython"]
+    except KeyError:
+        return tldm
+
+    try:
+        if "IPKernelApp" not in ipython.get_ipython().config:  # pragma: no cover
+            return tldm
+    except AttributeError:  # pragma: no cover
+        # `get_ipython()` returns None outside an interactive shell
+        return tldm
 
-        # Check if ipywidgets is available
+    try:
+        from .notebook import WARN_NOIPYW, IProgress
+        from .notebook import tldm as notebook_tldm
+    except ImportError:  # pragma: no cover
+        return tldm
+
+    # Check if ipywidgets is available
+    if IProgress is None:
         from warnings import warn
 
-        from .notebook import WARN_NOIPYW
         from .std import TldmWarning
 
-        try:
-            from .notebook import IProgress
-        except ImportError:
-            IProgress = None
+        warn(WARN_NOIPYW, TldmWarning, stacklevel=2)
+        return tldm
 
-        if IProgress is None:
-            warn(WARN_NOIPYW, TldmWarning, stacklevel=2)
-            raise ImportError("ipywidgets")
+    return notebook_tldm
 
-        # Use notebook version
-        from .notebook import tldm as notebook_tldm
 
-        return notebook_tldm
-    except Exception:
-        # Fallback to standard tldm
-        return tldm
+def _resolve_auto_tldm() -> type[tldm]:
+    """Resolve and memoize `auto_tldm`, running environment detection once."""
+    auto = globals().get("auto_tldm")
+    if auto is None:
+        auto = _get_auto_tldm()
+        globals()["auto_tldm"] = auto
+    return auto
 
 
-# Create auto alias - automatically selects notebook or standard tldm
-auto_tldm = _get_auto_tldm()
+def __getattr__(name: str) -> Any:
+    # PEP 562: defer the notebook/IPython environment probe until something
+    # actually asks for `auto_tldm` (see tests/test_lazy_imports.py).
+    if name == "auto_tldm":
+        return _resolve_auto_tldm()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def tenumerate(
@@ -80,7 +97,7 @@ def tenumerate(
     tldm_class  : [default: auto_tldm (automatically detected)].
     """
     if tldm_class is None:
-        tldm_class = auto_tldm
+        tldm_class = _resolve_auto_tldm()
     return enumerate(tldm_class(iterable, total=total, **tldm_kwargs), start)
 
 
@@ -94,11 +111,12 @@ def tzip(
     ----------
     tldm_class  : [default: auto_tldm (automatically detected)].
     """
-    kwargs = tldm_kwargs.copy()
-    tldm_class = kwargs.pop("tldm_class", None)
+    # `tldm_kwargs` is already a fresh per-call dict, so pop in place rather
+    # than copying.
+    tldm_class = tldm_kwargs.pop("tldm_class", None)
     if tldm_class is None:
-        tldm_class = auto_tldm
-    yield from zip(tldm_class(iter1, **kwargs), *iter2plus)
+        tldm_class = _resolve_auto_tldm()
+    yield from zip(tldm_class(iter1, **tldm_kwargs), *iter2plus)
 
 
 def tmap(function: Callable[..., R], *sequences: Iterable[Any], **tldm_kwargs: Any) -> Iterator[R]:
@@ -109,8 +127,14 @@ def tmap(function: Callable[..., R], *sequences: Iterable[Any], **tldm_kwargs: A
     ----------
     tldm_class  : [default: auto_tldm (automatically detected)].
     """
-    for i in tzip(*sequences, **tldm_kwargs):
-        yield function(*i)
+    tldm_class = tldm_kwargs.pop("tldm_class", None)
+    if tldm_class is None:
+        tldm_class = _resolve_auto_tldm()
+    # Wrap only the first sequence and let `map` drive the iteration at the
+    # C level, avoiding the extra generator frame per element that routing
+    # through `tzip` would cost.
+    wrapped = tldm_class(sequences[0], **tldm_kwargs)
+    return map(function, wrapped, *sequences[1:])
 
 
 def tproduct(*iterables: Iterable[T], **tldm_kwargs: Any) -> Iterator[tuple[T, ...]]:
@@ -121,26 +145,23 @@ def tproduct(*iterables: Iterable[T], **tldm_kwargs: Any) -> Iterator[tuple[T, .
     ----------
     tldm_class  : [default: auto_tldm (automatically detected)].
     """
-    kwargs = tldm_kwargs.copy()
-    repeat = kwargs.pop("repeat", 1)
-    tldm_class = kwargs.pop("tldm_class", None)
+    repeat = tldm_kwargs.pop("repeat", 1)
+    tldm_class = tldm_kwargs.pop("tldm_class", None)
     if tldm_class is None:
-        tldm_class = auto_tldm
+        tldm_class = _resolve_auto_tldm()
     try:
-        lens = list(map(length_hint, iterables))
+        base = prod(map(length_hint, iterables))
     except TypeError:
-        total = None
-    else:
-        total = 1
-        for i in lens:
-            total *= i
-        total = total**repeat
-        kwargs.setdefault("total", total)
-    with tldm_class(**kwargs) as t:
-        it = itertools.product(*iterables, repeat=repeat)
-        for val in it:
-            yield val
-            t.update()
+        base = 0
+    # `length_hint` returns 0 when no hint is available, so treat a zero
+    # product as "unknown" rather than advertising an empty bar. Skip the
+    # int pow on the common repeat=1 path.
+    if base:
+        tldm_kwargs.setdefault("total", base if repeat == 1 else base**repeat)
+    # Wrap the product iterator directly so counting goes through
+    # `tldm.__iter__`, which amortizes display work via miniters/mininterval
+    # instead of a Python-level `t.update()` call per element.
+    yield from tldm_class(itertools.product(*iterables, repeat=repeat), **tldm_kwargs)
 
 
 def tbatched(
@@ -200,7 +221,7 @@ def tbatched(
     if sys.version_info < (3, 12):
         raise ImportError("tbatched requires Python 3.12+ (itertools.batched)")
 
-    tldm_class = tldm_class or auto_tldm
+    tldm_class = tldm_class or _resolve_auto_tldm()
 
     # Calculate total number of batches
     if total is None:
@@ -223,11 +244,22 @@ def tbatched(
         batched_iter = itertools.batched(iterable, n)
 
     with tldm_class(**tldm_kwargs) as t:
+        # Bind the method once; saves an attribute lookup per batch.
+        update = t.update
         for batch in batched_iter:
             yield batch
-            t.update()
+            update()
 
 
 def trange(*args: int, **kwargs: Any) -> tldm:
-    """Shortcut for tldm(range(*args), **kwargs)."""
-    return auto_tldm(range(*args), **kwargs)
+    """
+    Shortcut for tldm(range(*args), **kwargs).
+
+    Parameters
+    ----------
+    tldm_class  : [default: auto_tldm (automatically detected)].
+    """
+    tldm_class: type[tldm] | None = kwargs.pop("tldm_class", None)
+    if tldm_class is None:
+        tldm_class = _resolve_auto_tldm()
+    return tldm_class(range(*args), **kwargs)
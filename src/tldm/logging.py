@@ -27,9 +27,9 @@ class TldmLoggingHandler(logging.StreamHandler):
 
     def emit(self, record: logging.LogRecord) -> None:
         try:
-            msg = self.format(record)
-            self.tldm_class.write(msg, file=self.stream)
-            self.flush()
+            # Flush inside `tldm.write` (while it already holds the lock)
+            # instead of a second handler-level flush per record.
+            self.tldm_class.write(self.format(record), file=self.stream, flush=True)
         except (KeyboardInterrupt, SystemExit):
             raise
         except:  # noqa: E722  # pylint: disable=bare-except
@@ -37,10 +37,10 @@ class TldmLoggingHandler(logging.StreamHandler):
 
 
 def _is_console_logging_handler(handler: logging.Handler) -> bool:
-    return isinstance(handler, logging.StreamHandler) and handler.stream in {
-        sys.stdout,
-        sys.stderr,
-    }
+    # Identity checks are cheaper than building a set per call.
+    return isinstance(handler, logging.StreamHandler) and (
+        handler.stream is sys.stdout or handler.stream is sys.stderr
+    )
 
 
 def _get_first_found_console_logging_handler(
@@ -93,7 +93,16 @@ def logging_redirect_tldm(
     try:
         for logger in loggers:
             tldm_handler = TldmLoggingHandler(tldm_class)
-            orig_handler = _get_first_found_console_logging_handler(logger.handlers)
+            # Capture the first console handler and drop them all in a single
+            # pass over the handler list.
+            orig_handler: logging.StreamHandler | None = None
+            new_handlers: list[logging.Handler] = []
+            for handler in logger.handlers:
+                if _is_console_logging_handler(handler):
+                    if orig_handler is None:
+                        orig_handler = handler  # type: ignore[assignment]
+                else:
+                    new_handlers.append(handler)
             if orig_handler is not None:
                 tldm_handler.setFormatter(orig_handler.formatter)
                 tldm_handler.setLevel(orig_handler.level)
@@ -101,9 +110,7 @@ def logging_redirect_tldm(
                 # Copy filters from original handler (issue #1581)
                 for f in orig_handler.filters:
                     tldm_handler.addFilter(f)
-            logger.handlers = [
-                handler for handler in logger.handlers if not _is_console_logging_handler(handler)
-            ] + [tldm_handler]
+            logger.handlers = new_handlers + [tldm_handler]
         yield
     finally:
         for logger, original_handlers in zip(loggers, original_handlers_list):
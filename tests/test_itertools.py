@@ -9,7 +9,7 @@ from io import StringIO
 
 import pytest
 
-from tldm.aliases import tbatched, tenumerate, tmap, tproduct, tzip
+from tldm.aliases import tbatched, tenumerate, tmap, tproduct, trange, tzip
 from tldm.std import tldm
 
 
@@ -114,6 +114,18 @@ def test_batched(tldm_kwargs):
         assert "4/4" in our_file.getvalue()
 
 
+def test_trange_tldm_class():
+    """Test that trange honors an explicit tldm_class instead of auto_tldm"""
+
+    class CustomTldm(tldm):
+        pass
+
+    with closing(StringIO()) as our_file:
+        bar = trange(9, tldm_class=CustomTldm, file=our_file)
+        assert isinstance(bar, CustomTldm)
+        assert list(bar) == list(range(9))
+
+
 @pytest.mark.skipif(sys.version_info < (3, 13), reason="strict parameter requires Python 3.13+")
 @pytest.mark.parametrize("tldm_kwargs", [{}, {"tldm_class": tldm}])
 def test_batched_strict(tldm_kwargs):